@@ -0,0 +1,66 @@
+# =============================================================================
+# NATIVE BUILD CHECK (run after: cythonize -i password_ext.pyx)
+# =============================================================================
+# Compares the compiled password_ext against the pure-Python hot loops in
+# password_utils so the two implementations can't silently drift apart.
+#   python check_password_ext.py
+# =============================================================================
+
+import sys
+
+import password_ext
+from password_utils import _py_classify_characters, _py_parse_hibp_response
+
+# Inputs both implementations must agree on, including malformed counts
+PASSWORDS = ("", "abc", "ABC", "123", "!@#", "aB3$", "ÄßΩ€😀", "x" * 40 + "A1!")
+RESPONSES = (
+    ("AAA:5\r\nBBB:7", "BBB"),
+    ("AAA:5\r\nBBB:7\r\n", "AAA"),
+    ("AAA:5\nBBB:7\n", "BBB"),
+    ("AAA:5\r\nBBB:7", "CCC"),
+    ("AAA: 3 \r\n", "AAA"),
+    ("AAA:\r\n", "AAA"),
+    ("AAA:12x\r\n", "AAA"),
+    ("AAA:12\rX\n", "AAA"),
+    ("AAA:99999999999999999999999\r\n", "AAA"),
+)
+
+
+def outcome(func, *args):
+    """
+    Returns func's result, or the exception type it raised.
+    """
+    try:
+        return func(*args)
+    except ValueError:
+        return ValueError
+
+
+def main():
+    """
+    Prints every mismatch.
+    Returns: process exit code (0 if the native build matches)
+    """
+    failures = 0
+    for password in PASSWORDS:
+        native = password_ext.classify_characters(password)
+        python = _py_classify_characters(password)
+        if native != python:
+            print(f"❌ classify_characters({password!r}): {native} != {python}")
+            failures += 1
+    for text, suffix in RESPONSES:
+        native = outcome(password_ext.parse_hibp_response, text, suffix)
+        python = outcome(_py_parse_hibp_response, text, suffix)
+        if native != python:
+            print(f"❌ parse_hibp_response({text!r}, {suffix!r}): {native} != {python}")
+            failures += 1
+    
+    if failures:
+        print(f"password_ext disagrees with password_utils in {failures} case(s); rebuild it.")
+        return 1
+    print("✅ password_ext matches the pure-Python implementation")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
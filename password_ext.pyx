@@ -0,0 +1,77 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# =============================================================================
+# OPTIONAL NATIVE HOT LOOPS (Cython)
+# =============================================================================
+# Compiled drop-in replacements for _classify_characters and
+# _parse_hibp_response in password_utils.py. Build in place with:
+#
+#   pip install cython
+#   cythonize -i password_ext.pyx
+#
+# password_utils falls back to the pure-Python versions when this module
+# isn't compiled, so building it is never required.
+# =============================================================================
+
+
+def classify_characters(str password):
+    """
+    Reports which character classes appear in the password.
+    Returns: (has_lower, has_upper, has_digit, has_symbol)
+    """
+    cdef bint has_lower = 0, has_upper = 0, has_digit = 0, has_symbol = 0
+    cdef Py_UCS4 c
+
+    # Typed Py_UCS4 iteration reads the string buffer directly, one
+    # compare per character, and stops once every class has been seen
+    for c in password:
+        if 97 <= c <= 122:      # a-z
+            has_lower = 1
+        elif 65 <= c <= 90:     # A-Z
+            has_upper = 1
+        elif 48 <= c <= 57:     # 0-9
+            has_digit = 1
+        elif c in "!@#$%^&*()-_=+[{]};:'\",<.>/?\\|`~":  # compiled to a C switch
+            has_symbol = 1
+        if has_lower and has_upper and has_digit and has_symbol:
+            break
+
+    return has_lower, has_upper, has_digit, has_symbol
+
+
+def parse_hibp_response(str text, str suffix):
+    """
+    Finds a SHA-1 suffix in a HIBP range response.
+    Returns: (is_pwned: Boolean, breach_count: int)
+    Raises: ValueError if the matched line's count isn't an integer
+    """
+    cdef Py_ssize_t idx = text.find(suffix + ':')
+    cdef Py_ssize_t start, i, end, n = len(text)
+    cdef long long count = 0
+    cdef int ndigits = 0
+    cdef Py_UCS4 c
+
+    if idx == -1:
+        return False, 0
+
+    # Fast path: read plain ASCII digits in place instead of slicing + int()
+    start = idx + len(suffix) + 1
+    i = start
+    while i < n and ndigits < 18:
+        c = text[i]
+        if c < 48 or c > 57:
+            break
+        count = count * 10 + (<long long>c - 48)
+        ndigits += 1
+        i += 1
+
+    # Only a digit run ending the line ("\n", "\r\n" or end of text) is
+    # taken as-is; anything else (spaces, junk, huge counts) goes through the
+    # same int() parsing as the pure-Python version so both always agree
+    if ndigits and (i == n or text[i] == '\n' or
+                    (text[i] == '\r' and (i + 1 == n or text[i + 1] == '\n'))):
+        return True, count
+
+    end = text.find('\n', start)
+    if end == -1:
+        end = n
+    return True, int(text[start:end].strip())
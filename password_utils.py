@@ -0,0 +1,429 @@
+# =============================================================================
+# PASSWORD UTILITIES (shared by the Flask app)
+# =============================================================================
+# Strength checking, hashing, blacklist and breach lookups live here so the
+# expensive singletons (Argon2 hasher, HIBP session, thread pools, common
+# password set) are built exactly once, however many apps import them.
+# =============================================================================
+
+import hashlib
+import bcrypt
+from argon2 import PasswordHasher  # ← NEW: Argon2 support
+from argon2.exceptions import HashingError
+import requests  # ← NEW: For API calls
+from requests.adapters import HTTPAdapter
+import os
+import functools
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# =============================================================================
+# COMMON PASSWORDS LIST (Top 100 for demo - expand to 10,000 in production)
+# =============================================================================
+# In production, load from a file containing 10,000+ common passwords
+# Download from: https://github.com/danielmiessler/SecLists/tree/master/Passwords
+# Drop it next to this file as common_passwords.txt (one password per line) or
+# point COMMON_PASSWORDS_FILE at it; entries are merged with the list below
+COMMON_PASSWORDS_FILE = os.environ.get(
+    "COMMON_PASSWORDS_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "common_passwords.txt"),
+)
+
+_BUILTIN_COMMON_PASSWORDS = frozenset({
+    'password', '123456', '123456789', 'qwerty', 'abc123', 'monkey', 
+    '1234567', 'letmein', 'trustno1', 'dragon', 'baseball', 'iloveyou',
+    'master', 'sunshine', 'ashley', 'bailey', 'shadow', 'superman',
+    'password1', '123123', 'admin', 'welcome', 'login', 'hello',
+    'passw0rd', 'password123', 'qwerty123', '12345678', '111111',
+    # Add more as needed...
+})
+
+
+def _load_common_passwords(path):
+    """
+    Builds the blacklist once at import, lowercased, as a frozenset so
+    lookups stay O(1) no matter how large the list file is.
+    """
+    if not os.path.isfile(path):
+        return _BUILTIN_COMMON_PASSWORDS
+    with open(path, "rt", encoding="utf-8", errors="ignore") as f:
+        loaded = frozenset(line.strip().lower() for line in f if line.strip())
+    return _BUILTIN_COMMON_PASSWORDS | loaded
+
+
+COMMON_PASSWORDS = _load_common_passwords(COMMON_PASSWORDS_FILE)
+
+# =============================================================================
+# CHARACTER CLASSES (built once, O(1) membership checks)
+# =============================================================================
+LOWERCASE_CHARS = frozenset(string.ascii_lowercase)
+UPPERCASE_CHARS = frozenset(string.ascii_uppercase)
+DIGIT_CHARS = frozenset(string.digits)
+SPECIAL_CHARS = frozenset("!@#$%^&*()-_=+[{]};:'\",<.>/?\\|`~")
+
+# =============================================================================
+# NON-SECURITY DIGESTS (MD5/SHA-256 demo hashes, HIBP SHA-1 prefix)
+# =============================================================================
+# usedforsecurity=False (Python 3.9+) lets OpenSSL builds skip the FIPS
+# wrapper for these digests; older Pythons don't accept the keyword
+try:
+    hashlib.new("md5", usedforsecurity=False)
+    _DIGEST_KWARGS = {"usedforsecurity": False}
+except TypeError:
+    _DIGEST_KWARGS = {}
+
+# =============================================================================
+# ARGON2 HASHER (shared across requests)
+# =============================================================================
+# PasswordHasher is stateless once configured, so build it once at import
+# instead of on every request.
+# Defaults follow OWASP's Argon2id guidance (46 MiB, 1 lane). Tune per host
+# with ARGON2_T / ARGON2_M (KiB) / ARGON2_P so one hash takes ~250-650ms
+# (see "Adjusting Argon2 Parameters" in the README)
+ARGON2_TIME_COST = int(os.environ.get("ARGON2_T", "3"))
+ARGON2_MEMORY_COST = int(os.environ.get("ARGON2_M", str(46 * 1024)))  # KiB
+ARGON2_PARALLELISM = int(os.environ.get("ARGON2_P", "1"))
+
+_ARGON2 = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=ARGON2_PARALLELISM,
+    hash_len=32,
+    salt_len=16,
+)
+
+# =============================================================================
+# BCRYPT COST FACTOR
+# =============================================================================
+# Each +1 doubles the work (2^rounds). Keep 12+ in production; drop to 4
+# locally for fast iteration, e.g. BCRYPT_ROUNDS=4 python app.py
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _bcrypt_cached(pw_bytes):
+    """
+    Memoized bcrypt hash for DEBUG/demo mode only.
+    
+    Re-submitting the same password returns the same hash (and salt),
+    so this must never be used outside debug mode.
+    """
+    return bcrypt.hashpw(pw_bytes, bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
+
+
+def _bcrypt_hash(pw_bytes, debug=False):
+    """
+    Generates the bcrypt hash, reusing a cached one in debug mode.
+    """
+    if debug:
+        return _bcrypt_cached(pw_bytes)
+    return bcrypt.hashpw(pw_bytes, bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
+
+
+# =============================================================================
+# BACKGROUND WORKERS
+# =============================================================================
+# EXECUTOR runs bcrypt only: bcrypt and argon2-cffi release the GIL in
+# their C code, so hashing bcrypt here while Argon2 runs on the request
+# thread (and HIBP on HIBP_EXECUTOR below) lets a request wait for
+# max(bcrypt, Argon2, HIBP) instead of their sum.
+# Every in-flight request submits one bcrypt job, so HASH_WORKERS should be
+# at least the server's thread count (waitress runs 8 in app.py) or bcrypt
+# jobs queue behind each other under load
+HASH_WORKERS = int(os.environ.get("HASH_WORKERS", "8"))
+EXECUTOR = ThreadPoolExecutor(max_workers=HASH_WORKERS)
+
+# HIBP lookups get their own, larger pool: they spend almost all their time
+# waiting on the network, so concurrent users' lookups run side by side
+# instead of queueing behind CPU-bound bcrypt jobs on EXECUTOR
+HIBP_WORKERS = int(os.environ.get("HIBP_WORKERS", "16"))
+HIBP_EXECUTOR = ThreadPoolExecutor(max_workers=HIBP_WORKERS)
+
+# =============================================================================
+# HAVE I BEEN PWNED CLIENT
+# =============================================================================
+# One shared session keeps TCP/TLS connections alive between lookups;
+# the pool is sized so every HIBP worker can hold its own connection
+HIBP_RANGE_URL = "https://api.pwnedpasswords.com/range/"
+HIBP_CACHE_TTL = int(os.environ.get("HIBP_CACHE_TTL", "3600"))  # seconds, <= 0 disables
+
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=HIBP_WORKERS))
+
+
+# =============================================================================
+# HOT LOOPS (pure Python, replaced by password_ext when it is compiled)
+# =============================================================================
+def _py_classify_characters(password):
+    """
+    Reports which character classes appear in the password.
+    Returns: (has_lower, has_upper, has_digit, has_symbol)
+    """
+    # Build the character set once, then test each class with a C-level
+    # isdisjoint() call instead of looping over the password in Python
+    chars = set(password)
+    return (
+        not chars.isdisjoint(LOWERCASE_CHARS),
+        not chars.isdisjoint(UPPERCASE_CHARS),
+        not chars.isdisjoint(DIGIT_CHARS),
+        not chars.isdisjoint(SPECIAL_CHARS),
+    )
+
+
+def _py_parse_hibp_response(text, suffix):
+    """
+    Finds a SHA-1 suffix in a HIBP range response.
+    Returns: (is_pwned: Boolean, breach_count: int)
+    Raises: ValueError if the matched line's count isn't an integer
+    """
+    # Response format: "SUFFIX:COUNT\r\n" (one per line)
+    # A single C-level find() replaces splitting every line in Python.
+    # Each line holds exactly one ':' right after its 35-char suffix,
+    # so a match can only start at the beginning of a line.
+    idx = text.find(suffix + ':')
+    if idx == -1:
+        # Not found - password is safe (so far)
+        return False, 0
+    
+    # Found! Password is in breach database
+    start = idx + len(suffix) + 1
+    end = text.find('\n', start)
+    if end == -1:
+        end = len(text)
+    return True, int(text[start:end].strip())
+
+
+# Optional native build of the two functions above:
+#   pip install cython && cythonize -i password_ext.pyx
+#   python check_password_ext.py   # confirms it matches the pure-Python versions
+try:
+    from password_ext import (
+        classify_characters as _classify_characters,
+        parse_hibp_response as _parse_hibp_response,
+    )
+except ImportError:
+    _classify_characters = _py_classify_characters
+    _parse_hibp_response = _py_parse_hibp_response
+
+
+# =============================================================================
+# FUNCTION 1: PASSWORD STRENGTH CHECKER (Phase 1 - unchanged)
+# =============================================================================
+def check_password_strength(password, debug=False):
+    """
+    Checks password strength based on 5 criteria.
+    Returns: (suggestions_list, score_number)
+    
+    debug=True reuses memoized results (pass app.debug). The memo is keyed
+    by the plaintext password, so like _bcrypt_cached it stays off in
+    production. A fresh list is returned each time because callers
+    (e.g. the index route) insert extra warnings into it.
+    """
+    check = _check_password_strength_cached if debug else _check_password_strength
+    suggestions, score = check(password)
+    return list(suggestions), score
+
+
+def _check_password_strength(password):
+    """
+    Uncached 5-criteria check behind check_password_strength.
+    Returns: (suggestions_tuple, score_number)
+    """
+    score = 0
+    suggestions = []
+
+    if len(password) >= 8:
+        score += 1
+    else:
+        suggestions.append("Make your password at least 8 characters long.")
+
+    has_lower, has_upper, has_digit, has_symbol = _classify_characters(password)
+
+    if has_lower:
+        score += 1
+    else:
+        suggestions.append("Add lowercase letters.")
+
+    if has_upper:
+        score += 1
+    else:
+        suggestions.append("Add uppercase letters.")
+
+    if has_digit:
+        score += 1
+    else:
+        suggestions.append("Add numbers.")
+
+    if has_symbol:
+        score += 1
+    else:
+        suggestions.append("Add special characters (like !, @, #, or $).")
+
+    return tuple(suggestions), score
+
+
+# Memoized strength check for DEBUG/demo mode only (holds plaintext keys)
+_check_password_strength_cached = functools.lru_cache(maxsize=4096)(_check_password_strength)
+
+
+# =============================================================================
+# FUNCTION 2: HASH GENERATOR (Enhanced for Phase 2)
+# =============================================================================
+def compute_digests(pw_bytes):
+    """
+    Computes every fast digest a request needs from the same buffer:
+    MD5 and SHA-256 for display, SHA-1 for the HIBP lookup.
+    
+    Keeping them together means each digest is computed once per request,
+    and gives one place to plug in a batch/multi-buffer hashing backend.
+    
+    Returns: (md5_hex, sha256_hex, sha1_hex_upper)
+    """
+    md5 = hashlib.new("md5", pw_bytes, **_DIGEST_KWARGS)
+    sha256 = hashlib.new("sha256", pw_bytes, **_DIGEST_KWARGS)
+    sha1 = hashlib.new("sha1", pw_bytes, **_DIGEST_KWARGS)
+    return md5.hexdigest(), sha256.hexdigest(), sha1.hexdigest().upper()
+
+
+def generate_slow_hashes(pw_bytes, debug=False):
+    """
+    ✅ SECURE HASHES - deliberately slow (hundreds of ms each).
+    
+    debug=True reuses cached bcrypt hashes (pass app.debug).
+    
+    Returns: {'bcrypt': ..., 'argon2': ...}
+    """
+    
+    # bcrypt (Phase 1) - runs on a worker thread while Argon2 runs here
+    bcrypt_future = EXECUTOR.submit(_bcrypt_hash, pw_bytes, debug)
+    
+    # 🆕 Argon2 (Phase 2 - NEW!)
+    # Argon2 won the Password Hashing Competition in 2015
+    # More resistant to GPU/ASIC attacks than bcrypt
+    try:
+        argon2_hash = _ARGON2.hash(pw_bytes)
+    except HashingError:
+        argon2_hash = "Error generating hash"
+    
+    return {
+        'bcrypt': bcrypt_future.result(),
+        'argon2': argon2_hash  # ← NEW!
+    }
+
+
+# =============================================================================
+# FUNCTION 3: CHECK COMMON PASSWORD (NEW - Phase 2)
+# =============================================================================
+def is_common_password(password):
+    """
+    Checks if password is in the common passwords list.
+    
+    EXPLANATION:
+    - Converts to lowercase for case-insensitive check
+    - Returns True if password is too common
+    - In production, this list should contain 10,000+ passwords
+    
+    Returns: Boolean (True if common, False if unique)
+    """
+    return password.lower() in COMMON_PASSWORDS
+
+
+# =============================================================================
+# FUNCTION 4: HAVE I BEEN PWNED CHECK (NEW - Phase 2)
+# =============================================================================
+@functools.lru_cache(maxsize=4096)
+def _fetch_range_cached(prefix, ttl_bucket):
+    """
+    Fetches the HIBP range response for a 5-char SHA-1 prefix.
+    
+    ttl_bucket is only part of the cache key: it changes every
+    HIBP_CACHE_TTL seconds, so stale entries stop being hit and age out
+    of the LRU. Errors raise instead of returning, so they are never cached.
+    """
+    response = _SESSION.get(HIBP_RANGE_URL + prefix, timeout=3)
+    if response.status_code != 200:
+        raise requests.HTTPError(f"HIBP returned {response.status_code}", response=response)
+    return response.text
+
+
+def _fetch_range(prefix):
+    """
+    Returns the (cached) HIBP range response text for a prefix.
+    """
+    if HIBP_CACHE_TTL <= 0:
+        # Caching disabled - always ask the API
+        return _fetch_range_cached.__wrapped__(prefix, 0)
+    return _fetch_range_cached(prefix, int(time.time() // HIBP_CACHE_TTL))
+
+
+def check_pwned_password(password, sha1_hash=None):
+    """
+    Checks if password appears in data breaches using Have I Been Pwned API.
+    
+    HOW IT WORKS (k-Anonymity Model):
+    1. Hash the password using SHA-1
+    2. Send only the first 5 characters of hash to API
+    3. API returns all hashes starting with those 5 chars
+    4. Check locally if full hash appears in results
+    
+    This way, your actual password NEVER leaves your machine!
+    
+    Pass sha1_hash (uppercase hex, e.g. from compute_digests) to skip
+    hashing the password again.
+    
+    Returns: (is_pwned: Boolean, breach_count: int)
+    """
+    
+    # Step 1: Hash password with SHA-1
+    if sha1_hash is None:
+        _, _, sha1_hash = compute_digests(password.encode())
+    
+    # Step 2: Split hash into prefix (first 5 chars) and suffix (rest)
+    prefix = sha1_hash[:5]
+    suffix = sha1_hash[5:]
+    
+    try:
+        # Step 3: Query Have I Been Pwned API with only the prefix
+        # (cached per prefix, over a pooled keep-alive session)
+        range_text = _fetch_range(prefix)
+        
+        # Step 4: Check if our suffix appears in the results
+        return _parse_hibp_response(range_text, suffix)
+        
+    except requests.RequestException:
+        # Network or API error - return safe default
+        return False, 0
+    except ValueError:
+        # Malformed API response (non-numeric count) - return safe default
+        return False, 0
+
+
+# =============================================================================
+# FUNCTION 5: DETERMINE STRENGTH LABEL & COLOR (Phase 1 - unchanged)
+# =============================================================================
+# Scores only ever range 0-5, so map them with a fixed table:
+# 0-2 → Weak, 3-4 → Moderate, 5 → Strong
+_STRENGTH_TABLE = (
+    ("Weak ❌", "red", "33%"),
+    ("Weak ❌", "red", "33%"),
+    ("Weak ❌", "red", "33%"),
+    ("Moderate ⚠️", "orange", "66%"),
+    ("Moderate ⚠️", "orange", "66%"),
+    ("Strong ✅", "green", "100%"),
+)
+
+# Converts numeric score to user-friendly (label, color, width)
+get_strength_info = _STRENGTH_TABLE.__getitem__
+
+
+# =============================================================================
+# CACHE MAINTENANCE
+# =============================================================================
+def clear_password_caches(*_):
+    """
+    Drops every cache keyed by raw passwords so they aren't held in
+    memory forever. app.py wires it to SIGHUP when run directly.
+    """
+    _check_password_strength_cached.cache_clear()
+    _bcrypt_cached.cache_clear()